@@ -7,8 +7,8 @@ from pathlib import Path
 
 # Third Party
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.exceptions import ValidationError, RequestValidationError
-from starlette.responses import JSONResponse
 from starlette.exceptions import HTTPException as StarletteHTTPException
 from fastapi.openapi.utils import get_openapi
 from starlette.staticfiles import StaticFiles
@@ -30,6 +30,7 @@ from hyperglass.api.routes import (
 )
 from hyperglass.exceptions import HyperglassError
 from hyperglass.configuration import URL_DEV, STATIC_PATH, params, devices
+from hyperglass.api.middleware import StaticCacheMiddleware
 from hyperglass.api.error_handlers import (
     app_handler,
     http_handler,
@@ -84,7 +85,7 @@ app = FastAPI(
     title=params.site_title,
     description=params.site_description,
     version=__version__,
-    default_response_class=JSONResponse,
+    default_response_class=ORJSONResponse,
     **DOCS_PARAMS,
 )
 
@@ -182,12 +183,15 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Cache Headers for Content-Hashed UI Assets
+app.add_middleware(StaticCacheMiddleware)
+
 app.add_api_route(
     path="/api/info",
     endpoint=info,
     methods=["GET"],
     response_model=InfoResponse,
-    response_class=JSONResponse,
+    response_class=ORJSONResponse,
     summary=params.docs.info.summary,
     description=params.docs.info.description,
     tags=[params.docs.info.title],
@@ -198,7 +202,7 @@ app.add_api_route(
     endpoint=routers,
     methods=["GET"],
     response_model=List[RoutersResponse],
-    response_class=JSONResponse,
+    response_class=ORJSONResponse,
     summary=params.docs.devices.summary,
     description=params.docs.devices.description,
     tags=[params.docs.devices.title],
@@ -217,7 +221,7 @@ app.add_api_route(
     path="/api/queries",
     endpoint=queries,
     methods=["GET"],
-    response_class=JSONResponse,
+    response_class=ORJSONResponse,
     response_model=List[SupportedQueryResponse],
     summary=params.docs.queries.summary,
     description=params.docs.queries.description,
@@ -237,7 +241,7 @@ app.add_api_route(
     },
     response_model=QueryResponse,
     tags=[params.docs.query.title],
-    response_class=JSONResponse,
+    response_class=ORJSONResponse,
 )
 
 # Enable certificate import route only if a device using
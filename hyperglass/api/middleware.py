@@ -0,0 +1,33 @@
+"""API Middleware."""
+
+# Third Party
+from starlette.types import Send, Scope, ASGIApp, Message, Receive
+from starlette.datastructures import MutableHeaders
+
+# Next.js places content-hashed build assets under this path, so their
+# content never changes for a given URL.
+IMMUTABLE_PREFIX = "/_next/static/"
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+class StaticCacheMiddleware:
+    """Add long-lived cache headers to content-hashed UI assets."""
+
+    def __init__(self, app: ASGIApp, prefix: str = IMMUTABLE_PREFIX) -> None:
+        """Wrap ASGI application."""
+        self.app = app
+        self.prefix = prefix
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Set Cache-Control on successful responses for matching paths."""
+        if scope["type"] != "http" or not scope["path"].startswith(self.prefix):
+            await self.app(scope, receive, send)
+            return
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start" and message["status"] == 200:
+                headers = MutableHeaders(scope=message)
+                headers["Cache-Control"] = IMMUTABLE_CACHE_CONTROL
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
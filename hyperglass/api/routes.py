@@ -2,13 +2,15 @@
 
 # Standard Library
 import os
-import json
 import time
 from datetime import datetime
+from functools import lru_cache
 
 # Third Party
+import orjson
 from fastapi import HTTPException, BackgroundTasks
 from starlette.requests import Request
+from starlette.responses import Response
 from fastapi.openapi.docs import get_redoc_html, get_swagger_ui_html
 
 # Project
@@ -28,6 +30,43 @@ from .fake_output import fake_output
 
 APP_PATH = os.environ["hyperglass_directory"]
 
+# Device, community, query & instance information are derived entirely from
+# the configuration, which is static once loaded, so build them once rather
+# than per request.
+ROUTERS = [
+    d.dict(
+        include={
+            "name": ...,
+            "network": ...,
+            "display_name": ...,
+            "vrfs": {-1: {"name", "display_name"}},
+        }
+    )
+    for d in devices.objects
+]
+COMMUNITIES = [c.export_dict() for c in params.queries.bgp_community.communities]
+QUERIES = params.queries.list
+INFO = {
+    "name": params.site_title,
+    "organization": params.org_name,
+    "primary_asn": int(params.primary_asn),
+    "version": f"hyperglass {__version__}",
+}
+
+
+@lru_cache(maxsize=None)
+def query_cache() -> AsyncCache:
+    """Get the query route's cache handler.
+
+    The handler is created on first use, from within the running event loop,
+    and reused by every subsequent query.
+    """
+    # Entries are stored as serialized JSON, so responses are left as bytes
+    # rather than decoded to strings.
+    return AsyncCache(
+        db=params.cache.database, **{**REDIS_CONFIG, "decode_responses": False}
+    )
+
 
 async def send_webhook(query_data: Query, request: Request, timestamp: datetime):
     """If webhooks are enabled, get request info and send a webhook.
@@ -75,21 +114,47 @@ async def query(query_data: Query, request: Request, background_tasks: Backgroun
     timestamp = datetime.utcnow()
     background_tasks.add_task(send_webhook, query_data, request, timestamp)
 
-    # Initialize cache
-    cache = AsyncCache(db=params.cache.database, **REDIS_CONFIG)
-    log.debug("Initialized cache {}", repr(cache))
+    cache = query_cache()
 
     # Use hashed query_data string as key for for k/v cache store so
     # each command output value is unique.
-    cache_key = query_data.digest()
+    cache_key = f"hyperglass.query.{query_data.digest()}"
 
     # Define cache entry expiry time
     cache_timeout = params.cache.timeout
 
     log.debug("Cache Timeout: {}", cache_timeout)
-    log.info("Starting query execution for query {}", query_data.summary)
+    # Summarize the query once, as it's logged for every request.
+    summary = query_data.summary
+    log.info("Starting query execution for query {}", summary)
+
+    # Fetch the cached entry, if any, in one lookup. If a cached entry
+    # exists, its expiration time is reset by the same call.
+    cache_entry = await cache.get_raw(cache_key, seconds=cache_timeout)
+
+    if cache_entry is not None:
+        log.debug("Query {} exists in cache", cache_key)
+        log.success("Completed query execution for query {}", summary)
+
+        # The cached entry is the serialized output, timestamp & format of
+        # the original response. Append the per-request fields to it as-is,
+        # rather than deserializing & re-serializing the output. Since this
+        # bypasses the response model, only include fields it defines.
+        request_fields = orjson.dumps(
+            {
+                "cached": True,
+                "runtime": 0,
+                "random": query_data.random(),
+                "level": "success",
+                "keywords": [],
+            }
+        )
+        return Response(
+            cache_entry[:-1] + b"," + request_fields[1:], media_type="application/json",
+        )
 
-    cache_response = await cache.get_dict(cache_key, "output")
+    log.debug("No existing cache entry for query {}", cache_key)
+    log.debug("Created new cache key {} entry for query {}", cache_key, summary)
 
     json_output = False
 
@@ -100,72 +165,44 @@ async def query(query_data: Query, request: Request, background_tasks: Backgroun
     ):
         json_output = True
 
-    cached = False
-    runtime = 65535
-    if cache_response:
-        log.debug("Query {} exists in cache", cache_key)
-
-        # If a cached response exists, reset the expiration time.
-        await cache.expire(cache_key, seconds=cache_timeout)
-
-        cached = True
-        runtime = 0
-        timestamp = await cache.get_dict(cache_key, "timestamp")
-
-    elif not cache_response:
-        log.debug("No existing cache entry for query {}", cache_key)
-        log.debug(
-            "Created new cache key {} entry for query {}", cache_key, query_data.summary
-        )
-
-        timestamp = query_data.timestamp
+    starttime = time.perf_counter()
 
-        starttime = time.time()
-
-        if params.fake_output:
-            # Return fake, static data for development purposes, if enabled.
-            cache_output = await fake_output(json_output)
-        else:
-            # Pass request to execution module
-            cache_output = await execute(query_data)
-
-        endtime = time.time()
-        elapsedtime = round(endtime - starttime, 4)
-        log.debug("Query {} took {} seconds to run.", cache_key, elapsedtime)
-
-        if cache_output is None:
-            raise HyperglassError(message=params.messages.general, alert="danger")
-
-        # Create a cache entry
-        if json_output:
-            raw_output = json.dumps(cache_output)
-        else:
-            raw_output = str(cache_output)
-        await cache.set_dict(cache_key, "output", raw_output)
-        await cache.set_dict(cache_key, "timestamp", timestamp)
-        await cache.expire(cache_key, seconds=cache_timeout)
+    if params.fake_output:
+        # Return fake, static data for development purposes, if enabled.
+        cache_output = await fake_output(json_output)
+    else:
+        # Pass request to execution module
+        cache_output = await execute(query_data)
 
-        log.debug("Added cache entry for query: {}", cache_key)
+    elapsedtime = time.perf_counter() - starttime
+    log.debug("Query {} took {:.4f} seconds to run.", cache_key, elapsedtime)
 
-        runtime = int(round(elapsedtime, 0))
+    if cache_output is None:
+        raise HyperglassError(message=params.messages.general, level="danger")
 
-    # If it does, return the cached entry
-    cache_response = await cache.get_dict(cache_key, "output")
     response_format = "text/plain"
 
     if json_output:
         response_format = "application/json"
+    else:
+        cache_output = str(cache_output)
 
-    log.debug("Cache match for {}:\n{}", cache_key, cache_response)
-    log.success("Completed query execution for query {}", query_data.summary)
+    # Create a cache entry
+    cache_fields = {
+        "output": cache_output,
+        "timestamp": query_data.timestamp,
+        "format": response_format,
+    }
+    await cache.set(cache_key, orjson.dumps(cache_fields), seconds=cache_timeout)
+
+    log.debug("Added cache entry for query: {}", cache_key)
+    log.success("Completed query execution for query {}", summary)
 
     return {
-        "output": cache_response,
+        **cache_fields,
         "id": cache_key,
-        "cached": cached,
-        "runtime": runtime,
-        "timestamp": timestamp,
-        "format": response_format,
+        "cached": False,
+        "runtime": round(elapsedtime),
         "random": query_data.random(),
         "level": "success",
         "keywords": [],
@@ -176,9 +213,7 @@ async def import_certificate(encoded_request: EncodedRequest):
     """Import a certificate from hyperglass-agent."""
 
     # Try to match the requested device name with configured devices
-    log.debug(
-        "Attempting certificate import for device '{}'", devices[encoded_request.device]
-    )
+    log.debug("Attempting certificate import for device '{}'", encoded_request.device)
     try:
         matched_device = devices[encoded_request.device]
     except AttributeError:
@@ -227,17 +262,7 @@ async def docs():
 
 async def routers():
     """Serve list of configured routers and attributes."""
-    return [
-        d.dict(
-            include={
-                "name": ...,
-                "network": ...,
-                "display_name": ...,
-                "vrfs": {-1: {"name", "display_name"}},
-            }
-        )
-        for d in devices.objects
-    ]
+    return ROUTERS
 
 
 async def communities():
@@ -245,22 +270,17 @@ async def communities():
     if params.queries.bgp_community.mode != "select":
         raise HTTPException(detail="BGP community mode is not select", status_code=404)
 
-    return [c.export_dict() for c in params.queries.bgp_community.communities]
+    return COMMUNITIES
 
 
 async def queries():
     """Serve list of enabled query types."""
-    return params.queries.list
+    return QUERIES
 
 
 async def info():
     """Serve general information about this instance of hyperglass."""
-    return {
-        "name": params.site_title,
-        "organization": params.org_name,
-        "primary_asn": int(params.primary_asn),
-        "version": f"hyperglass {__version__}",
-    }
+    return INFO
 
 
 endpoints = [query, docs, routers, info]
@@ -5,17 +5,26 @@ import json
 import time
 import pickle
 import asyncio
-from typing import Any, Dict
+import hashlib
+from typing import Any, Dict, Tuple, Union, Optional
 
 # Third Party
-from aredis import StrictRedis as AsyncRedis
-from aredis.pubsub import PubSub as AsyncPubSub
-from aredis.exceptions import RedisError
+from redis.asyncio import Redis as AsyncRedis
+from redis.asyncio import BlockingConnectionPool as AsyncConnectionPool
+from redis.exceptions import RedisError, ResponseError
+from redis.commands.core import AsyncScript
+from redis.asyncio.client import PubSub as AsyncPubSub
 
 # Project
-from hyperglass.cache.base import BaseCache
+from hyperglass.cache.base import GET_EXPIRE_SCRIPT, BaseCache
 from hyperglass.exceptions import HyperglassError
 
+# Connection pools & registered scripts shared by all AsyncCache instances
+# with the same connection parameters, so that creating a cache handler per
+# request reuses open connections instead of opening new ones.
+POOLS: Dict[Tuple, AsyncConnectionPool] = {}
+SCRIPTS: Dict[Tuple, AsyncScript] = {}
+
 
 class AsyncCache(BaseCache):
     """Asynchronous Redis cache handler."""
@@ -28,14 +37,35 @@ class AsyncCache(BaseCache):
         if password is not None:
             password = password.get_secret_value()
 
-        self.instance: AsyncRedis = AsyncRedis(
-            db=self.db,
-            host=self.host,
-            port=self.port,
-            password=password,
-            decode_responses=self.decode_responses,
+        pool_args = {
+            "db": self.db,
+            "host": self.host,
+            "port": self.port,
+            "password": password,
+            "decode_responses": self.decode_responses,
+            "socket_keepalive": True,
+            # Wait for a free connection rather than opening an unbounded
+            # number of them under load.
+            "max_connections": 50,
             **self.redis_args,
-        )
+        }
+        # Key pools on a hash of the password, rather than the password itself.
+        key_args = {**pool_args}
+        if password is not None:
+            key_args["password"] = hashlib.sha256(password.encode()).hexdigest()
+        pool_key = tuple(sorted((k, repr(v)) for k, v in key_args.items()))
+
+        if pool_key not in POOLS:
+            POOLS[pool_key] = AsyncConnectionPool(**pool_args)
+
+        self.instance: AsyncRedis = AsyncRedis(connection_pool=POOLS[pool_key])
+
+        if pool_key not in SCRIPTS:
+            # Calling the registered script sends EVALSHA. If Redis doesn't have
+            # the script cached, redis-py sends SCRIPT LOAD & retries EVALSHA.
+            SCRIPTS[pool_key] = self.instance.register_script(GET_EXPIRE_SCRIPT)
+
+        self._get_expire: AsyncScript = SCRIPTS[pool_key]
 
     async def test(self):
         """Send an echo to Redis to ensure it can be reached."""
@@ -81,9 +111,20 @@ class AsyncCache(BaseCache):
 
         return self.parse_types(raw)
 
-    async def set(self, key: str, value: str) -> bool:
-        """Set cache values."""
-        return await self.instance.set(key, value)
+    async def set(
+        self, key: str, value: Union[str, bytes], seconds: Optional[int] = None
+    ) -> bool:
+        """Set cache values, optionally with a timeout in seconds."""
+        return await self.instance.set(key, value, ex=seconds)
+
+    async def set_many(
+        self, values: Dict[str, str], seconds: Optional[int] = None
+    ) -> None:
+        """Set multiple cache values in one round-trip, optionally with a timeout."""
+        async with self.instance.pipeline(transaction=False) as pipe:
+            for key, value in values.items():
+                pipe.set(key, value, ex=seconds)
+            await pipe.execute()
 
     async def set_dict(self, key: str, field: str, value: str) -> bool:
         """Set hash map (dict) values."""
@@ -101,6 +142,15 @@ class AsyncCache(BaseCache):
 
         return success
 
+    async def get_raw(self, key: str, seconds: Optional[int] = None) -> Optional[bytes]:
+        """Get an item from cache as-is, without decoding or type parsing.
+
+        If `seconds` is set, the key's timeout is reset in the same round-trip.
+        """
+        if seconds is None:
+            return await self.instance.get(key)
+        return await self._get_expire(keys=[key], args=[seconds])
+
     async def wait(self, pubsub: AsyncPubSub, timeout: int = 30, **kwargs) -> Any:
         """Wait for pub/sub messages & return posted message."""
         now = time.time()
@@ -120,7 +170,7 @@ class AsyncCache(BaseCache):
         return None
 
     async def pubsub(self) -> AsyncPubSub:
-        """Provide an aredis.pubsub.Pubsub instance."""
+        """Provide a redis.asyncio.client.PubSub instance."""
         return self.instance.pubsub()
 
     async def pub(self, key: str, value: str) -> None:
@@ -129,8 +179,12 @@ class AsyncCache(BaseCache):
         await self.instance.publish(key, value)
 
     async def clear(self) -> None:
-        """Clear the cache."""
-        await self.instance.flushdb()
+        """Clear the cache without blocking the Redis server (FLUSHDB ASYNC)."""
+        try:
+            await self.instance.flushdb(asynchronous=True)
+        except ResponseError:
+            # Redis versions prior to 4.0 don't support FLUSHDB ASYNC.
+            await self.instance.flushdb()
 
     async def delete(self, *keys: str) -> None:
         """Delete a cache key."""
@@ -8,6 +8,15 @@ from typing import Any, Optional
 # Third Party
 from pydantic import SecretStr
 
+# Lua script to get a key's value & reset its timeout in one round-trip.
+GET_EXPIRE_SCRIPT = """
+local value = redis.call("GET", KEYS[1])
+if value then
+    redis.call("EXPIRE", KEYS[1], ARGV[1])
+end
+return value
+"""
+
 
 class BaseCache:
     """Redis cache handler."""
@@ -4,12 +4,12 @@
 import json
 import time
 import pickle
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 # Third Party
 from redis import Redis as SyncRedis
 from redis.client import PubSub as SyncPubsSub
-from redis.exceptions import RedisError
+from redis.exceptions import RedisError, ResponseError
 
 # Project
 from hyperglass.cache.base import BaseCache
@@ -84,6 +84,13 @@ class SyncCache(BaseCache):
         """Set cache values."""
         return self.instance.set(key, str(value))
 
+    def set_many(self, values: Dict[str, str], seconds: Optional[int] = None) -> None:
+        """Set multiple cache values in one round-trip, optionally with a timeout."""
+        with self.instance.pipeline(transaction=False) as pipe:
+            for key, value in values.items():
+                pipe.set(key, str(value), ex=seconds)
+            pipe.execute()
+
     def set_dict(self, key: str, field: str, value: str) -> bool:
         """Set hash map (dict) values."""
         success = False
@@ -128,8 +135,12 @@ class SyncCache(BaseCache):
         self.instance.publish(key, value)
 
     def clear(self) -> None:
-        """Clear the cache."""
-        self.instance.flushdb()
+        """Clear the cache without blocking the Redis server (FLUSHDB ASYNC)."""
+        try:
+            self.instance.flushdb(asynchronous=True)
+        except ResponseError:
+            # Redis versions prior to 4.0 don't support FLUSHDB ASYNC.
+            self.instance.flushdb()
 
     def delete(self, *keys: str) -> None:
         """Delete a cache key."""
@@ -68,7 +68,9 @@ class Construct:
 
     def json(self, afi):
         """Return JSON version of validated query for REST devices."""
-        log.debug("Building JSON query for {q}", q=repr(self.query_data))
+        log.opt(lazy=True).debug(
+            "Building JSON query for {q}", q=lambda: repr(self.query_data)
+        )
         return _json.dumps(
             {
                 "query_type": self.query_data.query_type,
@@ -100,7 +100,7 @@ class NetmikoConnection(SSHConnection):
             for query in self.query:
                 raw = nm_connect_direct.send_command(query, **send_args)
                 responses += (raw,)
-                log.debug(f'Raw response for command "{query}":\n{raw}')
+                log.debug('Raw response for command "{}":\n{}', query, raw)
 
             nm_connect_direct.disconnect()
 
@@ -121,7 +121,7 @@ class ScrapliConnection(SSHConnection):
                 for query in self.query:
                     raw = await connection.send_command(query)
                     responses += (raw.result,)
-                    log.debug(f'Raw response for command "{query}":\n{raw.result}')
+                    log.debug('Raw response for command "{}":\n{}', query, raw.result)
 
         except ScrapliTimeout as err:
             log.error(err)
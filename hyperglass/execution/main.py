@@ -46,7 +46,7 @@ async def execute(query: Query) -> Union[str, Sequence[Dict]]:
 
     output = params.messages.general
 
-    log.debug("Received query for {}", query.json())
+    log.opt(lazy=True).debug("Received query for {}", query.json)
     log.debug("Matched device config: {}", query.device)
 
     mapped_driver = map_driver(query.device.driver)
@@ -90,7 +90,9 @@ async def execute(query: Query) -> Union[str, Sequence[Dict]]:
                 params.messages.no_output, device_name=query.device.name
             )
 
-    log.debug("Output for query: {}:\n{}", query.json(), repr(output))
+    log.opt(lazy=True).debug(
+        "Output for query: {}:\n{}", query.json, lambda: repr(output)
+    )
     signal.alarm(0)
 
     return output
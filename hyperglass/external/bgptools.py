@@ -6,6 +6,7 @@
 
 # Standard Library
 import re
+import json
 import socket
 import asyncio
 from typing import Dict, List
@@ -19,6 +20,10 @@ DEFAULT_KEYS = ("asn", "ip", "prefix", "country", "rir", "allocated", "org")
 
 CACHE_KEY = "hyperglass.external.bgptools"
 
+# Network info is cached per resource, with a timeout, since resources
+# include arbitrary client addresses & would otherwise grow without bound.
+CACHE_TIMEOUT = 86400
+
 
 def parse_whois(output: str, targets: List[str]) -> Dict[str, str]:
     """Parse raw whois output from bgp.tools.
@@ -127,8 +132,16 @@ async def network_info(*targets: str) -> Dict[str, Dict[str, str]]:
     # Set default data structure.
     data = {t: {k: "" for k in DEFAULT_KEYS} for t in targets}
 
-    # Get all cached bgp.tools data.
-    cached = await cache.get_dict(CACHE_KEY)
+    # Get cached bgp.tools data for the requested resources only.
+    cached = {}
+    if targets:
+        values = await cache.get(*(f"{CACHE_KEY}.{t}" for t in targets))
+
+        # A single key returns a single value rather than a list.
+        if len(targets) == 1:
+            values = [values]
+
+        cached = {t: v for t, v in zip(targets, values) if v is not None}
 
     # Try to use cached data for each of the items in the list of
     # resources.
@@ -151,9 +164,11 @@ async def network_info(*targets: str) -> Dict[str, Dict[str, str]]:
                 data.update(parse_whois(whoisdata, targets))
 
                 # Cache the response
-                for t in targets:
-                    await cache.set_dict(CACHE_KEY, t, data[t])
-                    log.debug("Cached network info for {}", t)
+                await cache.set_many(
+                    {f"{CACHE_KEY}.{t}": json.dumps(data[t]) for t in targets},
+                    seconds=CACHE_TIMEOUT,
+                )
+                log.debug("Cached network info for {}", ", ".join(targets))
 
     except Exception as err:
         log.error(str(err))
@@ -170,8 +185,16 @@ def network_info_sync(*targets: str) -> Dict[str, Dict[str, str]]:
     # Set default data structure.
     data = {t: {k: "" for k in DEFAULT_KEYS} for t in targets}
 
-    # Get all cached bgp.tools data.
-    cached = cache.get_dict(CACHE_KEY)
+    # Get cached bgp.tools data for the requested resources only.
+    cached = {}
+    if targets:
+        values = cache.get(*(f"{CACHE_KEY}.{t}" for t in targets))
+
+        # A single key returns a single value rather than a list.
+        if len(targets) == 1:
+            values = [values]
+
+        cached = {t: v for t, v in zip(targets, values) if v is not None}
 
     # Try to use cached data for each of the items in the list of
     # resources.
@@ -194,9 +217,11 @@ def network_info_sync(*targets: str) -> Dict[str, Dict[str, str]]:
                 data.update(parse_whois(whoisdata, targets))
 
                 # Cache the response
-                for t in targets:
-                    cache.set_dict(CACHE_KEY, t, data[t])
-                    log.debug("Cached network info for {}", t)
+                cache.set_many(
+                    {f"{CACHE_KEY}.{t}": json.dumps(data[t]) for t in targets},
+                    seconds=CACHE_TIMEOUT,
+                )
+                log.debug("Cached network info for {}", ", ".join(targets))
 
     except Exception as err:
         log.error(str(err))
@@ -93,8 +93,11 @@ class Query(BaseModel):
         )
 
     def digest(self):
-        """Create SHA256 hash digest of model representation."""
-        return hashlib.sha256(repr(self).encode()).hexdigest()
+        """Create a compact, order-invariant hash digest of the query fields."""
+        canonical = json.dumps(
+            self.export_dict(), sort_keys=True, separators=(",", ":"), default=str
+        )
+        return hashlib.blake2b(canonical.encode(), digest_size=16).hexdigest()
 
     def random(self):
         """Create a random string to prevent client or proxy caching."""
@@ -165,10 +168,7 @@ class Query(BaseModel):
     def validate_query_location(cls, value):
         """Ensure query_location is defined."""
 
-        valid_id = value in devices._ids
-        valid_hostname = value in devices.hostnames
-
-        if not any((valid_id, valid_hostname)):
+        if value not in devices:
             raise InputInvalid(
                 params.messages.invalid_field,
                 level="warning",
@@ -293,6 +293,7 @@ class Devices(HyperglassModelExtra):
     objects: List[Device] = []
     all_nos: List[StrictStr] = []
     default_vrf: Vrf = Vrf(name="default", display_name="Global")
+    _lookup: Dict[str, Device] = PrivateAttr(default_factory=dict)
 
     def __init__(self, input_params: List[Dict]) -> None:
         """Import loaded YAML, initialize per-network definitions.
@@ -373,12 +374,19 @@ class Devices(HyperglassModelExtra):
 
         super().__init__(**init_kwargs)
 
+        # Map each device's ID & name to the device object once, so that
+        # per-query device lookups don't iterate over every device.
+        for device in self.objects:
+            self._lookup.setdefault(device._id, device)
+            self._lookup.setdefault(device.name, device)
+
     def __getitem__(self, accessor: str) -> Device:
         """Get a device by its name."""
-        for device in self.objects:
-            if device._id == accessor:
-                return device
-            elif device.name == accessor:
-                return device
+        if accessor in self._lookup:
+            return self._lookup[accessor]
 
         raise AttributeError(f"No device named '{accessor}'")
+
+    def __contains__(self, accessor: str) -> bool:
+        """Determine if a device exists by its ID or name."""
+        return accessor in self._lookup
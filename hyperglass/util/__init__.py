@@ -61,12 +61,12 @@ async def write_env(variables: Dict) -> str:
 
 async def clear_redis_cache(db: int, config: Dict) -> bool:
     """Clear the Redis cache."""
-    # Third Party
-    import aredis
+    # Project
+    from hyperglass.cache import AsyncCache
 
     try:
-        redis_instance = aredis.StrictRedis(db=db, **config)
-        await redis_instance.flushdb()
+        cache = AsyncCache(db=db, **config)
+        await cache.clear()
     except Exception as e:
         raise RuntimeError(f"Error clearing cache: {str(e)}") from None
     return True